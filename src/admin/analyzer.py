@@ -8,7 +8,10 @@ Performs:
 from __future__ import annotations
 
 import ast
+import hashlib
 import logging
+import re
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -30,6 +33,26 @@ FORBIDDEN_BUILTINS = frozenset({
     "breakpoint", "exit", "quit",
 })
 
+# Capability combinations that warrant a composition warning when requested together
+_SENSITIVE_CAPABILITIES: frozenset[str] = frozenset({"user:input", "memory:write"})
+
+# String literals containing any of these are flagged as suspicious
+_SUSPICIOUS_STRING_RE = re.compile(r"__import__|eval\(|exec\(")
+
+# Memoized safety-scan results, keyed by a digest of the analyzed source.
+# Insertion order doubles as LRU order: hits are re-inserted at the end and
+# the oldest entry is evicted once the cap is exceeded.
+_PARSE_CACHE: dict[bytes, tuple[str, ...]] = {}
+_PARSE_CACHE_MAX = 1024
+
+# Memoized analyze_file results, keyed by (source digest, proposed
+# capabilities, active-skill fingerprint). Same LRU scheme as above.
+_ANALYSIS_CACHE: dict[tuple, AnalysisResult] = {}
+_ANALYSIS_CACHE_MAX = 256
+
+# Guards both caches; the admin service may analyze proposals on worker threads
+_CACHE_LOCK = threading.Lock()
+
 
 @dataclass
 class AnalysisResult:
@@ -48,57 +71,166 @@ def analyze_code_safety(code: str) -> list[str]:
     """Static analysis of generated Python code for forbidden patterns.
 
     Returns a list of warning strings. Empty list means no issues found.
+
+    Results are cached by source digest, so re-analyzing identical code
+    (retries, re-reviews) skips the parse and tree walk.
     """
-    warnings: list[str] = []
+    source = code.encode("utf-8")
+    return _analyze_source(source, _digest(source))
+
+
+def _analyze_source(source: bytes, digest: bytes) -> list[str]:
+    """Cached safety scan over raw source bytes (see analyze_code_safety)."""
+    with _CACHE_LOCK:
+        cached = _PARSE_CACHE.pop(digest, None)
+        if cached is not None:
+            _PARSE_CACHE[digest] = cached
+            return list(cached)
+
+    cached = tuple(_scan_code(source))
+    with _CACHE_LOCK:
+        _PARSE_CACHE.pop(digest, None)
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+            del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+        _PARSE_CACHE[digest] = cached
+    return list(cached)
+
+
+def clear_parse_cache() -> None:
+    """Drop all memoized safety-scan and analyze_file results."""
+    with _CACHE_LOCK:
+        _PARSE_CACHE.clear()
+        _ANALYSIS_CACHE.clear()
+
+
+def _digest(source: bytes) -> bytes:
+    return hashlib.blake2b(source, digest_size=16).digest()
+
 
+def _scan_code(source: str | bytes) -> list[str]:
+    """Parse the source and collect its forbidden-pattern warnings."""
     try:
-        tree = ast.parse(code)
+        tree = ast.parse(source)
     except SyntaxError as e:
         return [f"Syntax error in generated code: {e}"]
 
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                top_module = alias.name.split(".")[0]
-                if top_module in FORBIDDEN_IMPORTS:
-                    warnings.append(f"Forbidden import: '{alias.name}' (line {node.lineno})")
-
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                top_module = node.module.split(".")[0]
-                if top_module in FORBIDDEN_IMPORTS:
-                    warnings.append(
-                        f"Forbidden import from: '{node.module}' (line {node.lineno})"
-                    )
-
-        elif isinstance(node, ast.Call):
-            func_name = _get_call_name(node)
-            if func_name in FORBIDDEN_BUILTINS:
-                warnings.append(f"Forbidden builtin call: '{func_name}' (line {node.lineno})")
-
-        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
-            val = node.value
-            if any(pattern in val for pattern in ("__import__", "eval(", "exec(")):
-                warnings.append(
-                    f"Suspicious string containing code execution pattern (line {node.lineno})"
+    visitor = _SafetyVisitor()
+    visitor.scan(tree)
+    return visitor.warnings
+
+
+class _SafetyVisitor:
+    """Single-pass AST scanner that records forbidden imports, calls, and strings.
+
+    Traversal is an explicit pre-order stack walk over ``_fields`` (no
+    recursion, no per-node generators); node types of interest are
+    dispatched through the module-level ``_HANDLERS`` table.
+    """
+
+    def __init__(self) -> None:
+        self.warnings: list[str] = []
+        self._docstrings: set[ast.Constant] = set()
+
+    def scan(self, tree: ast.AST) -> None:
+        handlers = _HANDLERS
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            handler = handlers.get(type(node))
+            if handler is not None:
+                handler(self, node)
+
+            children: list[ast.AST] = []
+            for name in node._fields:
+                value = getattr(node, name, None)
+                if isinstance(value, list):
+                    children.extend(v for v in value if isinstance(v, ast.AST))
+                elif isinstance(value, ast.AST):
+                    children.append(value)
+            # Push in reverse so children pop in source order
+            children.reverse()
+            stack.extend(children)
+
+    def _warn(self, message: str) -> None:
+        self.warnings.append(message)
+
+    def _visit_with_docstring(
+        self, node: ast.Module | ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef,
+    ) -> None:
+        # Docstrings are inert documentation; exclude them from the string scan
+        body = node.body
+        if body and isinstance(body[0], ast.Expr):
+            value = body[0].value
+            if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                self._docstrings.add(value)
+
+    def _visit_import(self, node: ast.Import) -> None:
+        for alias in node.names:
+            top_module = alias.name.partition(".")[0]
+            if top_module in FORBIDDEN_IMPORTS:
+                self._warn(f"Forbidden import: '{alias.name}' (line {node.lineno})")
+
+    def _visit_import_from(self, node: ast.ImportFrom) -> None:
+        if node.module:
+            top_module = node.module.partition(".")[0]
+            if top_module in FORBIDDEN_IMPORTS:
+                self._warn(
+                    f"Forbidden import from: '{node.module}' (line {node.lineno})"
                 )
 
-    return warnings
+    def _visit_call(self, node: ast.Call) -> None:
+        func = node.func
+        if isinstance(func, ast.Name):
+            func_name = func.id
+        elif isinstance(func, ast.Attribute):
+            func_name = func.attr
+        else:
+            func_name = ""
+        if func_name in FORBIDDEN_BUILTINS:
+            self._warn(f"Forbidden builtin call: '{func_name}' (line {node.lineno})")
+
+    def _visit_constant(self, node: ast.Constant) -> None:
+        if node in self._docstrings:
+            return
+        val = node.value
+        if isinstance(val, str) and _SUSPICIOUS_STRING_RE.search(val):
+            self._warn(
+                f"Suspicious string containing code execution pattern (line {node.lineno})"
+            )
+
+
+# Node type → _SafetyVisitor handler, looked up once per node by scan()
+_HANDLERS = {
+    ast.Module: _SafetyVisitor._visit_with_docstring,
+    ast.ClassDef: _SafetyVisitor._visit_with_docstring,
+    ast.FunctionDef: _SafetyVisitor._visit_with_docstring,
+    ast.AsyncFunctionDef: _SafetyVisitor._visit_with_docstring,
+    ast.Import: _SafetyVisitor._visit_import,
+    ast.ImportFrom: _SafetyVisitor._visit_import_from,
+    ast.Call: _SafetyVisitor._visit_call,
+    ast.Constant: _SafetyVisitor._visit_constant,
+}
 
 
 def analyze_composition(
     proposal_capabilities: list[str],
-    active_skill_capabilities: dict[str, list[str]],
+    active_skill_capabilities: dict[str, list[str] | frozenset[str]],
 ) -> list[str]:
     """Check for capability conflicts between proposed and active skills.
 
     Returns a list of warnings about potential composition issues.
     """
     warnings: list[str] = []
-    proposed_set = set(proposal_capabilities)
+    proposed_set = frozenset(proposal_capabilities)
 
     for skill_name, caps in active_skill_capabilities.items():
-        overlap = proposed_set & set(caps)
+        caps_set = caps if isinstance(caps, frozenset) else frozenset(caps)
+        # Probe the larger set while iterating the smaller one
+        small, large = (
+            (proposed_set, caps_set) if len(proposed_set) <= len(caps_set)
+            else (caps_set, proposed_set)
+        )
+        overlap = [c for c in small if c in large]
         if overlap:
             warnings.append(
                 f"Proposed skill shares capabilities with '{skill_name}': "
@@ -106,8 +238,7 @@ def analyze_composition(
             )
 
     # Warn about particularly sensitive capability combinations
-    sensitive = {"user:input", "memory:write"}
-    if sensitive.issubset(proposed_set):
+    if _SENSITIVE_CAPABILITIES <= proposed_set:
         warnings.append(
             "Proposed skill has both user:input and memory:write — "
             "can write arbitrary data to memory from user input"
@@ -123,36 +254,55 @@ def analyze_file(code_path: Path, proposal: dict, active_skills: dict) -> Analys
         code_path: Path to the generated Python file.
         proposal: The proposal dict (from YAML).
         active_skills: Map of skill name → capability list for active skills.
+
+    Results are memoized on the code digest plus the proposed and active
+    capabilities; each call returns an independent copy.
     """
     result = AnalysisResult()
 
-    # Read code
+    # Read code as bytes: hashed for the caches and decoded by ast.parse itself
     try:
-        code = code_path.read_text(encoding="utf-8")
+        source = code_path.read_bytes()
     except Exception as e:
         result.clean = False
         result.issues.append(f"Cannot read implementation file: {e}")
         return result
 
-    # AST safety scan
-    safety_issues = analyze_code_safety(code)
-    if safety_issues:
-        result.clean = False
-        result.issues.extend(safety_issues)
-
-    # Composition analysis
+    digest = _digest(source)
     spec = proposal.get("proposal", {})
     capabilities = spec.get("capabilities", [])
-    comp_warnings = analyze_composition(capabilities, active_skills)
-    result.composition_warnings.extend(comp_warnings)
-
-    return result
-
+    key = (
+        digest,
+        tuple(sorted(capabilities)),
+        tuple(sorted((name, tuple(sorted(caps))) for name, caps in active_skills.items())),
+    )
+
+    with _CACHE_LOCK:
+        cached = _ANALYSIS_CACHE.pop(key, None)
+        if cached is not None:
+            _ANALYSIS_CACHE[key] = cached
+
+    if cached is None:
+        # AST safety scan
+        safety_issues = _analyze_source(source, digest)
+        if safety_issues:
+            result.clean = False
+            result.issues.extend(safety_issues)
+
+        # Composition analysis
+        comp_warnings = analyze_composition(capabilities, active_skills)
+        result.composition_warnings.extend(comp_warnings)
+
+        cached = result
+        with _CACHE_LOCK:
+            _ANALYSIS_CACHE.pop(key, None)
+            if len(_ANALYSIS_CACHE) >= _ANALYSIS_CACHE_MAX:
+                del _ANALYSIS_CACHE[next(iter(_ANALYSIS_CACHE))]
+            _ANALYSIS_CACHE[key] = cached
+
+    return AnalysisResult(
+        clean=cached.clean,
+        issues=list(cached.issues),
+        composition_warnings=list(cached.composition_warnings),
+    )
 
-def _get_call_name(node: ast.Call) -> str:
-    """Extract the function name from a Call node."""
-    if isinstance(node.func, ast.Name):
-        return node.func.id
-    if isinstance(node.func, ast.Attribute):
-        return node.func.attr
-    return ""
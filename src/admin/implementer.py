@@ -8,6 +8,7 @@ proposal specs.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import re
@@ -20,11 +21,22 @@ logger = logging.getLogger(__name__)
 
 _INFEASIBLE_PREFIX = "INFEASIBLE:"
 
+# Markdown code fences wrapped around LLM output
+_FENCE_OPEN_RE = re.compile(r"^```\w*\n?")
+_FENCE_CLOSE_RE = re.compile(r"\n?```$")
+
+# Security-policy lists rendered into the prompt (invariant per process)
+_FORBIDDEN_IMPORTS_STR = ", ".join(sorted(FORBIDDEN_IMPORTS))
+_FORBIDDEN_BUILTINS_STR = ", ".join(sorted(FORBIDDEN_BUILTINS))
+
 
 class InfeasibleProposalError(Exception):
     """Raised when the LLM determines a proposal cannot be implemented within constraints."""
 
-_IMPLEMENTATION_PROMPT = """\
+# The implementation prompt is split so that only the per-proposal block goes
+# through str.format; the static interface docs and security rules around it
+# are built once at import time.
+_PROMPT_PREFIX = """\
 Generate a complete Python skill module for the Clawless agent framework.
 
 ## Skill interface
@@ -53,7 +65,7 @@ Required overrides for each BaseTool:
 - name (property) -> str: tool name for LLM function-calling (e.g. "get_weather")
 - description (property) -> str: what the tool does (shown to the LLM)
 - parameters_schema (property) -> dict: JSON Schema for input parameters, e.g.:
-    {{"type": "object", "properties": {{"location": {{"type": "string", "description": "City name"}}}}, "required": ["location"]}}
+    {"type": "object", "properties": {"location": {"type": "string", "description": "City name"}}, "required": ["location"]}
 - execute(self, **kwargs) -> str: execute the tool and return a result string (or JSON string)
 
 The LLM calls tools with parameters populated from conversation context and user memories.
@@ -66,6 +78,9 @@ it will call get_weather(location="Berlin") automatically.
 - SkillResult: success (bool), output (str), data (dict)
 - BaseTool: name, description, parameters_schema, execute(**kwargs) -> str
 
+"""
+
+_PROMPT_DYNAMIC_TEMPLATE = """\
 ## System context
 Python version: {python_version}
 Installed packages: {installed_packages}
@@ -83,8 +98,11 @@ Rationale: {rationale}
 ## Rules
 1. Only import from: clawless.user.skills.base, clawless.user.types, and standard library
 2. Additional third-party imports are allowed ONLY from: {installed_packages}
-3. Do NOT import any of these modules (they are blocked by security policy): {forbidden_imports}
-4. Do NOT call any of these builtins: {forbidden_builtins}
+"""
+
+_PROMPT_SUFFIX = f"""\
+3. Do NOT import any of these modules (they are blocked by security policy): {_FORBIDDEN_IMPORTS_STR}
+4. Do NOT call any of these builtins: {_FORBIDDEN_BUILTINS_STR}
 5. Write clean, well-structured Python 3.11+ code
 6. Include appropriate error handling
 7. The module should be self-contained
@@ -117,10 +135,9 @@ def generate_implementation(
     spec = proposal.get("proposal", {})
 
     # Filter out forbidden modules from the available packages list
-    allowed_packages = [
-        pkg for pkg in system_context.get("installed_packages", [])
-        if pkg.lower().replace("-", "_") not in FORBIDDEN_IMPORTS
-    ]
+    allowed_packages = _filter_allowed_packages(
+        tuple(system_context.get("installed_packages", ()))
+    )
 
     # Format tools spec for the prompt
     tools_spec = spec.get("tools", [])
@@ -129,7 +146,7 @@ def generate_implementation(
     else:
         tools_str = "(none specified — infer appropriate tools from the description)"
 
-    prompt = _IMPLEMENTATION_PROMPT.format(
+    prompt = _PROMPT_PREFIX + _PROMPT_DYNAMIC_TEMPLATE.format(
         python_version=system_context.get("python_version", "3.11"),
         installed_packages=", ".join(allowed_packages),
         platform=system_context.get("platform", "unknown"),
@@ -140,9 +157,7 @@ def generate_implementation(
         handles_events=", ".join(spec.get("handles_events", [])),
         tools=tools_str,
         rationale=spec.get("rationale", ""),
-        forbidden_imports=", ".join(sorted(FORBIDDEN_IMPORTS)),
-        forbidden_builtins=", ".join(sorted(FORBIDDEN_BUILTINS)),
-    )
+    ) + _PROMPT_SUFFIX
 
     raw = llm_chat(
         messages=[{"role": "user", "content": prompt}],
@@ -159,6 +174,19 @@ def generate_implementation(
     return code
 
 
+@functools.lru_cache(maxsize=8)
+def _filter_allowed_packages(packages: tuple[str, ...]) -> tuple[str, ...]:
+    """Drop installed packages whose normalized name is a forbidden import.
+
+    Cached because the installed-package list is effectively constant for
+    the lifetime of the admin process.
+    """
+    return tuple(
+        pkg for pkg in packages
+        if pkg.lower().replace("-", "_") not in FORBIDDEN_IMPORTS
+    )
+
+
 def write_implementation(code: str, slug: str, output_dir: Path) -> Path:
     """Write generated code to a file in the output directory.
 
@@ -180,7 +208,7 @@ def _clean_code(raw: str) -> str:
     """Strip markdown fences and leading/trailing whitespace from LLM output."""
     text = raw.strip()
     if text.startswith("```"):
-        text = re.sub(r"^```\w*\n?", "", text)
-        text = re.sub(r"\n?```$", "", text)
+        text = _FENCE_OPEN_RE.sub("", text, count=1)
+        text = _FENCE_CLOSE_RE.sub("", text, count=1)
         text = text.strip()
     return text
@@ -6,16 +6,18 @@ Starts the proposal pipeline loop. Run with: cl-admin
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
-
-from clawless.admin.notifier import CLINotifier
-from clawless.admin.service import AdminService
-from clawless.user.config import load_settings
-from clawless.user.llm import LLMRouter
+# Heavy imports (yaml, pydantic settings, httpx, the service itself) are
+# deferred to the helpers that need them so --help and argparse errors
+# return without paying for them.
+if TYPE_CHECKING:
+    from clawless.admin.service import AdminService
+    from clawless.user.llm import LLMRouter
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -104,13 +106,19 @@ def _load_admin_config(path: Path | None = None) -> dict:
         path = _find_admin_config()
     if path is None or not path.is_file():
         return {}
+    import yaml
+
     with open(path) as f:
         data = yaml.safe_load(f)
     return data if isinstance(data, dict) else {}
 
 
+@functools.lru_cache(maxsize=1)
 def _build_system_context() -> dict:
-    """Gather system context for the implementation generator."""
+    """Gather system context for the implementation generator.
+
+    Computed once per process; callers must treat the result as read-only.
+    """
     import platform as plat
 
     context = {
@@ -121,14 +129,15 @@ def _build_system_context() -> dict:
     return context
 
 
-def _get_installed_packages() -> list[str]:
-    """List installed Python packages."""
+@functools.lru_cache(maxsize=1)
+def _get_installed_packages() -> tuple[str, ...]:
+    """List installed Python packages (scanned once per process)."""
     try:
         from importlib.metadata import distributions
 
-        return sorted({d.metadata["Name"] for d in distributions() if d.metadata["Name"]})
+        return tuple(sorted({d.metadata["Name"] for d in distributions() if d.metadata["Name"]}))
     except Exception:
-        return []
+        return ()
 
 
 def _build_service(args: argparse.Namespace, need_llm: bool = True) -> tuple[AdminService, LLMRouter | None]:
@@ -141,6 +150,11 @@ def _build_service(args: argparse.Namespace, need_llm: bool = True) -> tuple[Adm
     Returns:
         Tuple of (AdminService, LLMRouter or None).
     """
+    from clawless.admin.notifier import CLINotifier
+    from clawless.admin.service import AdminService
+    from clawless.user.config import load_settings
+    from clawless.user.llm import LLMRouter
+
     config_path = Path(args.config) if args.config else None
     settings = load_settings(config_path)
 
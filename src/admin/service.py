@@ -11,13 +11,16 @@ proceed automatically.
 
 from __future__ import annotations
 
+import copy
 import logging
+import os
 import re
-import select
+import selectors
 import shutil
 import sys
 import time
-from datetime import datetime, timezone
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -26,12 +29,61 @@ import yaml
 from clawless.admin.analyzer import analyze_file
 from clawless.admin.implementer import generate_implementation, write_implementation
 from clawless.admin.notifier import Notifier
+from clawless.admin.watcher import ProposalWatcher
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader/dumper; fall back to pure Python if unavailable
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # Valid proposal statuses in lifecycle order
 _STATUSES = ("new", "discovered", "implementation", "agent-review", "human-review", "accepted", "rejected")
 
+# Statuses that end the pipeline; such proposals are skipped on every scan
+_TERMINAL_STATUSES = ("accepted", "rejected")
+
+# Current status → (next status, AdminService action method name)
+_PIPELINE = {
+    "new": ("discovered", "_validate_schema"),
+    "discovered": ("implementation", "_generate_code"),
+    "implementation": ("agent-review", "_run_analysis"),
+    "agent-review": ("human-review", None),
+    "human-review": ("accepted", "_install_skill"),
+}
+
+# Upper bound on proposals advanced concurrently within one scan
+_MAX_SCAN_WORKERS = min(8, os.cpu_count() or 2)
+
+# With a watcher, still do a full scan this often (seconds) to pick up
+# anything a missed filesystem event left behind
+_WATCH_RESCAN_INTERVAL = 10
+
+# Top-level BaseSkill subclass declaration in generated code
+_SKILL_CLASS_RE = re.compile(r"^class\s+(\w+)\s*\([^)]*\bBaseSkill\b[^)]*\)", re.MULTILINE)
+
+# Top-level ``status:`` key in a dumped proposal (nested keys are indented)
+_STATUS_LINE_RE = re.compile(rb"^status:[ \t]*([A-Za-z_-]+)[ \t]*\r?$", re.MULTILINE)
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last _utcnow_iso call
+_last_utc_second: tuple[int, str] = (-1, "")
+
+
+def _utcnow_iso() -> str:
+    """Return the current UTC time as ``datetime.now(timezone.utc).isoformat()`` would.
+
+    Built from time.time_ns(); the date/time part is reused within a second.
+    """
+    global _last_utc_second
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, stamp = _last_utc_second
+    if cached_second != seconds:
+        stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _last_utc_second = (seconds, stamp)
+    if micros:
+        return f"{stamp}.{micros:06d}+00:00"
+    return f"{stamp}+00:00"
+
 
 class AdminService:
     """Pipeline loop for processing skill proposals."""
@@ -55,33 +107,98 @@ class AdminService:
         self._llm_chat = llm_chat
         self._system_context = system_context or {}
         self._poll_interval = poll_interval
+        # path → (st_mtime_ns, st_size, parsed YAML); see _read_proposal
+        self._proposal_cache: dict[Path, tuple[int, int, Any]] = {}
+        # path → (st_mtime_ns, st_size) of files last seen in a terminal status
+        self._terminal_files: dict[Path, tuple[int, int]] = {}
+        # proposal id / slug → file, filled as proposals are read or saved;
+        # see _lookup_paths
+        self._id_index: dict[str, Path] = {}
+        self._slug_index: dict[str, Path] = {}
+        # (st_mtime_ns, st_size, parsed manifest); see _read_manifest
+        self._manifest_cache: tuple[int, int, dict] | None = None
 
     def run_loop(self) -> None:
-        """Run the continuous polling loop with interactive command support."""
-        logger.info(
-            "Admin service started — polling %s every %ds",
-            self._proposals_dir,
-            self._poll_interval,
+        """Run the continuous processing loop with interactive command support.
+
+        With the optional ``watchdog`` dependency the loop wakes as soon as a
+        proposal file changes and only re-scans the whole proposals directory
+        as a slow housekeeping pass; otherwise it re-scans every poll interval.
+        Either way it wakes on stdin commands.
+        """
+        watcher = (
+            ProposalWatcher.start(self._proposals_dir)
+            if self._proposals_dir.is_dir() else None
         )
+        if watcher is None:
+            logger.info(
+                "Admin service started — polling %s every %ds",
+                self._proposals_dir,
+                self._poll_interval,
+            )
+        else:
+            logger.info("Admin service started — watching %s", self._proposals_dir)
         print("  Type 'help' for available commands.\n")
-        while True:
-            try:
-                self._scan_and_process()
-            except KeyboardInterrupt:
-                logger.info("Admin service stopped by user")
-                break
-            except Exception:
-                logger.exception("Error in admin service loop")
-            # Wait for poll_interval, but wake on stdin input
-            try:
-                ready, _, _ = select.select([sys.stdin], [], [], self._poll_interval)
-                if ready:
-                    line = sys.stdin.readline().strip()
-                    if line:
-                        self._handle_command(line)
-            except KeyboardInterrupt:
-                logger.info("Admin service stopped by user")
-                break
+
+        # Register stdin (and the watcher) once instead of rebuilding fd sets per wait
+        selector = self._make_selector([sys.stdin] if watcher is None else [sys.stdin, watcher])
+
+        changed: set[Path] | None = None  # None → full directory scan
+        last_full_scan = 0.0
+        try:
+            while True:
+                try:
+                    if changed is None:
+                        last_full_scan = time.monotonic()
+                        self._scan_and_process()
+                    else:
+                        self._process_paths(changed)
+                except KeyboardInterrupt:
+                    logger.info("Admin service stopped by user")
+                    break
+                except Exception:
+                    logger.exception("Error in admin service loop")
+                changed = None
+                # Wait for the next poll / proposal change, but wake on stdin input.
+                # With a watcher the housekeeping rescan is due on a fixed timer
+                # from the last full scan, however many events arrive meanwhile.
+                if watcher is None:
+                    timeout = self._poll_interval
+                else:
+                    rescan_at = last_full_scan + _WATCH_RESCAN_INTERVAL
+                    timeout = max(0.0, rescan_at - time.monotonic())
+                try:
+                    ready = {key.fileobj for key, _ in selector.select(timeout)}
+                    if watcher is not None:
+                        pending = watcher.drain()
+                        if time.monotonic() < rescan_at:
+                            changed = pending  # otherwise the full scan covers them
+                    if sys.stdin in ready:
+                        line = sys.stdin.readline().strip()
+                        if line:
+                            self._handle_command(line)
+                except KeyboardInterrupt:
+                    logger.info("Admin service stopped by user")
+                    break
+        finally:
+            selector.close()
+            if watcher is not None:
+                watcher.stop()
+
+    @staticmethod
+    def _make_selector(fileobjs: list) -> selectors.BaseSelector:
+        """Return a selector with ``fileobjs`` registered for reading."""
+        selector = selectors.DefaultSelector()
+        try:
+            for fileobj in fileobjs:
+                selector.register(fileobj, selectors.EVENT_READ)
+        except PermissionError:
+            # epoll refuses regular files (e.g. stdin redirected from a file)
+            selector.close()
+            selector = selectors.SelectSelector()
+            for fileobj in fileobjs:
+                selector.register(fileobj, selectors.EVENT_READ)
+        return selector
 
     def run_once(self) -> None:
         """Process all pending proposals once (for testing / one-shot mode)."""
@@ -96,10 +213,9 @@ class AdminService:
             return []
 
         results = []
-        for path in sorted(self._proposals_dir.glob("proposed_*.yaml")):
+        for path in self._proposal_paths():
             try:
-                with open(path) as f:
-                    data = yaml.safe_load(f)
+                data = self._read_proposal(path)
                 if not isinstance(data, dict):
                     continue
                 status = data.get("status", "unknown")
@@ -133,10 +249,9 @@ class AdminService:
         if not self._proposals_dir.is_dir():
             raise ValueError("Proposals directory not found")
 
-        for path in self._proposals_dir.glob("proposed_*.yaml"):
+        for path in self._lookup_paths(id_or_slug):
             try:
-                with open(path) as f:
-                    data = yaml.safe_load(f)
+                data = self._read_proposal(path)
                 if not isinstance(data, dict):
                     continue
                 spec = data.get("proposal", {})
@@ -188,10 +303,9 @@ class AdminService:
         if not self._proposals_dir.is_dir():
             raise ValueError("Proposals directory not found")
 
-        for path in self._proposals_dir.glob("proposed_*.yaml"):
+        for path in self._lookup_paths(id_or_slug):
             try:
-                with open(path) as f:
-                    data = yaml.safe_load(f)
+                data = self._read_proposal(path)
                 if not isinstance(data, dict):
                     continue
                 spec = data.get("proposal", {})
@@ -257,19 +371,12 @@ class AdminService:
                 p.get("status", ""),
             ))
 
-        # Calculate column widths
-        widths = [len(h) for h in headers]
-        for row in rows:
-            for i, val in enumerate(row):
-                widths[i] = max(widths[i], len(val))
+        # Column widths in one pass per column, then a single format string
+        widths = [max(map(len, col)) for col in zip(headers, *rows)]
+        fmt = "  " + " | ".join(f"{{:<{w}}}" for w in widths)
 
-        def fmt_row(values: tuple) -> str:
-            return "  " + " | ".join(v.ljust(widths[i]) for i, v in enumerate(values))
-
-        lines = [fmt_row(headers)]
-        lines.append("  " + "-+-".join("-" * w for w in widths))
-        for row in rows:
-            lines.append(fmt_row(row))
+        lines = [fmt.format(*headers), "  " + "-+-".join("-" * w for w in widths)]
+        lines.extend([fmt.format(*row) for row in rows])
         return "\n".join(lines)
 
     def _handle_command(self, line: str) -> None:
@@ -307,37 +414,128 @@ class AdminService:
         if not self._proposals_dir.is_dir():
             return
 
-        for path in sorted(self._proposals_dir.glob("proposed_*.yaml")):
-            try:
-                proposal = self._load_proposal(path)
-                if proposal is None:
-                    continue
-                self._process_proposal(proposal, path)
-            except Exception:
-                logger.exception("Failed to process proposal %s", path.name)
+        self._process_files(self._proposal_paths())
 
-    def _process_proposal(self, proposal: dict, path: Path) -> None:
-        """Drive a single proposal through the pipeline."""
-        status = proposal.get("status", "new")
+    def _proposal_paths(self) -> list[Path]:
+        """Return the proposal files in the proposals directory, sorted by name.
 
-        if status == "new":
-            self._transition(proposal, path, "discovered", self._validate_schema)
-
-        status = proposal.get("status")
-        if status == "discovered":
-            self._transition(proposal, path, "implementation", self._generate_code)
+        Uses os.scandir with a plain prefix/suffix check; directory entries
+        carry their file type, so no per-file stat is needed.
+        """
+        names = []
+        with os.scandir(self._proposals_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (
+                    name.startswith("proposed_") and name.endswith(".yaml")
+                    and entry.is_file(follow_symlinks=False)
+                ):
+                    names.append(name)
+        names.sort()
+        return [self._proposals_dir / name for name in names]
+
+    def _lookup_paths(self, id_or_slug: str) -> Iterator[Path]:
+        """Yield the indexed file for an ID or slug first, then every proposal file.
+
+        The index is only a hint: callers still check the parsed proposal, so
+        a stale entry just falls through to the full scan.
+        """
+        hit = self._id_index.get(id_or_slug) or self._slug_index.get(id_or_slug)
+        if hit is not None and hit.is_file():
+            yield hit
+        for path in self._proposal_paths():
+            if path != hit:
+                yield path
+
+    def _index_proposal(self, path: Path, data: Any) -> None:
+        """Record a proposal's id and slug for _lookup_paths."""
+        if not isinstance(data, dict):
+            return
+        spec = data.get("proposal")
+        if not isinstance(spec, dict):
+            return
+        if isinstance(spec.get("id"), str):
+            self._id_index[spec["id"]] = path
+        if isinstance(spec.get("slug"), str):
+            self._slug_index[spec["slug"]] = path
+
+    def _process_paths(self, paths: set[Path]) -> None:
+        """Advance only the given proposal files (changes reported by the watcher)."""
+        self._process_files([path for path in sorted(paths) if path.is_file()])
+
+    def _process_files(self, paths: list[Path]) -> None:
+        """Load the given proposal files and advance every pending one.
+
+        Pending proposals are independent (their own file, LLM call and
+        analysis), so when more than one is pending the automatic stages run
+        on a small thread pool first. Human gates and installs read stdin and
+        write the shared skills directory and manifest, so they always run
+        afterwards, one proposal at a time, on the calling thread.
+        """
+        pending = []
+        for path in paths:
+            proposal = self._load_proposal(path)
+            if proposal is not None:
+                pending.append((proposal, path))
+
+        if len(pending) > 1:
+            pool = ThreadPoolExecutor(
+                max_workers=min(_MAX_SCAN_WORKERS, len(pending)),
+                thread_name_prefix="proposal",
+            )
+            try:
+                futures = [
+                    pool.submit(self._advance, proposal, path, interactive=False)
+                    for proposal, path in pending
+                ]
+                for future in futures:
+                    future.result()
+            finally:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        for proposal, path in pending:
+            self._advance(proposal, path)
+
+    def _advance(self, proposal: dict, path: Path, interactive: bool = True) -> None:
+        """Drive one loaded proposal through the pipeline, logging any failure."""
+        try:
+            self._process_proposal(proposal, path, interactive)
+        except Exception:
+            logger.exception("Failed to process proposal %s", path.name)
 
-        status = proposal.get("status")
-        if status == "implementation":
-            self._transition(proposal, path, "agent-review", self._run_analysis)
+    def _process_proposal(self, proposal: dict, path: Path, interactive: bool = True) -> None:
+        """Drive a single proposal through the pipeline.
 
-        status = proposal.get("status")
-        if status == "agent-review":
-            self._transition(proposal, path, "human-review", None)
+        With ``interactive`` false the pass stops before any human gate or
+        install, leaving those for a later pass on the main thread.
 
-        status = proposal.get("status")
-        if status == "human-review":
-            self._transition(proposal, path, "accepted", self._install_skill)
+        Transitions only update the proposal in memory; the file is written
+        once after the pass (and before any blocking human gate) instead of
+        being re-serialized after every step. Likewise the notifier hears
+        about the pass once, with the status it ended in.
+        """
+        saved_history_len = len(proposal.get("history", []))
+        try:
+            start_status = status = proposal.get("status", "new")
+            while status in _PIPELINE:
+                target, action_name = _PIPELINE[status]
+                if not interactive and (
+                    action_name == "_install_skill"
+                    or self._gates.get(target, "auto") == "human"
+                ):
+                    break
+                action = getattr(self, action_name) if action_name else None
+                if not self._transition(proposal, path, target, action):
+                    break
+                status = target
+            # Rejections notify on their own; only report progress that stuck
+            if status != start_status and proposal.get("status") == status:
+                self._notifier.notify(
+                    proposal, status, f"Transitioned {start_status} → {status}",
+                )
+        finally:
+            if len(proposal.get("history", [])) != saved_history_len:
+                self._save_proposal(proposal, path)
 
     def _transition(
         self,
@@ -345,11 +543,14 @@ class AdminService:
         path: Path,
         target_status: str,
         action: callable | None,
-    ) -> None:
+    ) -> bool:
         """Attempt to transition a proposal to the next status.
 
         Checks the gate config, optionally runs an action, and requests
-        human approval if the gate requires it.
+        human approval if the gate requires it. The updated proposal is
+        persisted, and the transition announced, by _process_proposal.
+
+        Returns True if the proposal moved to ``target_status``.
         """
         gate = self._gates.get(target_status, "auto")
 
@@ -362,22 +563,23 @@ class AdminService:
                     proposal, path, f"Action failed: {e}",
                     reason_type=type(e).__name__,
                 )
-                return
+                return False
 
         # Check gate
         if gate == "human":
+            # Persist progress so far before blocking on a human
+            self._save_proposal(proposal, path)
             context = proposal.get("_context", {})
             approved = self._notifier.request_approval(proposal, target_status, context)
             if not approved:
                 self._reject(proposal, path, f"Rejected at {target_status} gate")
-                return
+                return False
 
         # Transition
         proposal["status"] = target_status
         self._append_history(proposal, target_status, "admin-service")
-        self._save_proposal(proposal, path)
-        self._notifier.notify(proposal, target_status, f"Transitioned to {target_status}")
         logger.info("Proposal %s → %s", path.name, target_status)
+        return True
 
     def _validate_schema(self, proposal: dict, path: Path) -> None:
         """Validate the proposal YAML has required fields."""
@@ -495,15 +697,28 @@ class AdminService:
 
     @staticmethod
     def _extract_class_name(code_path: Path) -> str:
-        """Extract the BaseSkill subclass name from a generated implementation file."""
-        content = code_path.read_text(encoding="utf-8")
-        match = re.search(r"class\s+(\w+)\s*\(.*\bBaseSkill\b.*\)", content)
-        if not match:
-            raise RuntimeError(
-                f"No BaseSkill subclass found in {code_path}. "
-                f"Cannot determine class name for manifest entry."
-            )
-        return match.group(1)
+        """Extract the BaseSkill subclass name from a generated implementation file.
+
+        Reads line by line and stops at the first matching class statement.
+        """
+        with code_path.open(encoding="utf-8") as f:
+            for line in f:
+                if not line.startswith("class"):
+                    continue
+                header = line
+                # Base list continues on the following lines
+                while "(" in header and ")" not in header:
+                    continuation = next(f, "")
+                    if not continuation:
+                        break
+                    header += continuation
+                match = _SKILL_CLASS_RE.match(header)
+                if match:
+                    return match.group(1)
+        raise RuntimeError(
+            f"No BaseSkill subclass found in {code_path}. "
+            f"Cannot determine class name for manifest entry."
+        )
 
     @staticmethod
     def _slug_to_module_name(slug: str) -> str:
@@ -517,9 +732,7 @@ class AdminService:
                 f"Manifest file not found at {self._manifest_path}"
             )
 
-        with open(self._manifest_path) as f:
-            data = yaml.safe_load(f) or {}
-
+        data = self._read_manifest()
         skills = data.setdefault("skills", [])
         for entry in skills:
             if entry.get("module") == module_path:
@@ -529,33 +742,55 @@ class AdminService:
                 )
 
         skills.append({"module": module_path, "class": class_name})
-        with open(self._manifest_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        self._write_manifest(data)
         logger.info("Updated manifest: added %s.%s", module_path, class_name)
 
     def _remove_from_manifest(self, module_path: str) -> None:
         """Remove a skill entry from the manifest (rollback helper)."""
         if not self._manifest_path.is_file():
             return
-        with open(self._manifest_path) as f:
-            data = yaml.safe_load(f) or {}
+        data = self._read_manifest()
         skills = data.get("skills", [])
         data["skills"] = [e for e in skills if e.get("module") != module_path]
-        with open(self._manifest_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        self._write_manifest(data)
         logger.info("Rolled back manifest: removed %s", module_path)
 
+    def _read_manifest(self) -> dict:
+        """Return the parsed manifest, re-reading it only if it changed on disk.
+
+        Callers get a deep copy they may mutate and pass to _write_manifest.
+        """
+        st = self._manifest_path.stat()
+        cached = self._manifest_cache
+        if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+            with open(self._manifest_path) as f:
+                data = yaml.load(f, Loader=_YAML_LOADER) or {}
+            cached = (st.st_mtime_ns, st.st_size, data)
+            self._manifest_cache = cached
+        return copy.deepcopy(cached[2])
+
+    def _write_manifest(self, data: dict) -> None:
+        """Write the manifest back to disk, skipping the write if nothing changed."""
+        cached = self._manifest_cache
+        if cached is not None and cached[2] == data:
+            st = self._manifest_path.stat()
+            if cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return
+        with open(self._manifest_path, "w") as f:
+            yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
+        st = self._manifest_path.stat()
+        self._manifest_cache = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
+
     def _reject(
         self, proposal: dict, path: Path, reason: str,
         reason_type: str | None = None,
     ) -> None:
-        """Mark a proposal as rejected."""
+        """Mark a proposal as rejected (persisted by _process_proposal)."""
         proposal["status"] = "rejected"
         proposal["rejection_reason"] = reason
         if reason_type:
             proposal["rejection_reason_type"] = reason_type
         self._append_history(proposal, "rejected", "admin-service")
-        self._save_proposal(proposal, path)
         self._notifier.notify(proposal, "rejected", reason)
         logger.info("Proposal %s rejected: %s", path.name, reason)
 
@@ -569,21 +804,28 @@ class AdminService:
     def _append_history(proposal: dict, status: str, actor: str) -> None:
         history = proposal.setdefault("history", [])
         history.append({
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _utcnow_iso(),
             "status": status,
             "actor": actor,
         })
 
-    @staticmethod
-    def _load_proposal(path: Path) -> dict | None:
+    def _load_proposal(self, path: Path) -> dict | None:
         """Load a proposal YAML file."""
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
+            # Finished proposals that have not changed since are skipped on a stat
+            st = path.stat()
+            key = (st.st_mtime_ns, st.st_size)
+            if self._terminal_files.get(path) == key:
+                return None
+            # Skip terminal statuses without paying for a YAML parse
+            if self._peek_status(path) in _TERMINAL_STATUSES:
+                self._terminal_files[path] = key
+                return None
+            data = self._read_proposal(path)
             if not isinstance(data, dict):
                 return None
-            # Skip terminal statuses
-            if data.get("status") in ("accepted", "rejected"):
+            if data.get("status") in _TERMINAL_STATUSES:
+                self._terminal_files[path] = key
                 return None
             return data
         except Exception:
@@ -591,9 +833,51 @@ class AdminService:
             return None
 
     @staticmethod
-    def _save_proposal(proposal: dict, path: Path) -> None:
+    def _peek_status(path: Path) -> str | None:
+        """Read a proposal's top-level status with a regex scan instead of a YAML parse.
+
+        Returns None when no plain ``status: <word>`` line is found, in which
+        case callers fall back to a full parse.
+        """
+        with open(path, "rb") as f:
+            match = _STATUS_LINE_RE.search(f.read())
+        return match.group(1).decode("ascii") if match else None
+
+    def _read_proposal(self, path: Path) -> Any:
+        """Parse a proposal file, reusing the cached parse while it is unchanged on disk.
+
+        The cache is validated against the file's mtime and size; callers get
+        a deep copy they are free to mutate.
+        """
+        st = path.stat()
+        cached = self._proposal_cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return copy.deepcopy(cached[2])
+
+        with open(path) as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+        self._proposal_cache[path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
+        self._index_proposal(path, data)
+        return data
+
+    def _save_proposal(self, proposal: dict, path: Path) -> None:
         """Save proposal back to its YAML file."""
         # Remove internal context before saving
         clean = {k: v for k, v in proposal.items() if not k.startswith("_")}
-        with open(path, "w") as f:
-            yaml.dump(clean, f, default_flow_style=False, sort_keys=False)
+        data = yaml.dump(
+            clean, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+        ).encode("utf-8")
+        # Write to a sibling temp file and rename so readers never see a torn file
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            raise
+        st = path.stat()
+        self._proposal_cache[path] = (st.st_mtime_ns, st.st_size, copy.deepcopy(clean))
+        self._index_proposal(path, clean)
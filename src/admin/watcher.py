@@ -0,0 +1,100 @@
+"""Event-driven proposals directory watcher.
+
+Optional: requires the ``watchdog`` package (``pip install clawless[watch]``).
+When it is available the admin loop wakes on filesystem events for
+``proposed_*.yaml`` files instead of re-scanning the directory every poll
+interval. Without it, ``ProposalWatcher.start`` returns None and the service
+keeps polling.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PROPOSAL_PATTERN = "proposed_*.yaml"
+
+
+class ProposalWatcher:
+    """Collects changed proposal paths from watchdog events.
+
+    The watcher exposes ``fileno()`` (the read end of a self-pipe) so it can
+    be passed to ``select.select`` alongside stdin; the pipe becomes readable
+    whenever new paths are pending.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._pending: set[Path] = set()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._observer = None
+
+    @classmethod
+    def start(cls, directory: Path) -> ProposalWatcher | None:
+        """Start watching ``directory``. Returns None if watchdog is not installed."""
+        try:
+            from watchdog.events import PatternMatchingEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.debug("watchdog not installed — falling back to polling")
+            return None
+
+        watcher = cls(directory)
+
+        class _Handler(PatternMatchingEventHandler):
+            def on_any_event(self, event) -> None:
+                if event.event_type not in ("created", "modified", "moved", "closed"):
+                    return
+                dest = getattr(event, "dest_path", "")
+                watcher._push(Path(os.fsdecode(dest or event.src_path)))
+
+        observer = Observer()
+        observer.schedule(
+            _Handler(patterns=[PROPOSAL_PATTERN], ignore_directories=True),
+            str(directory),
+            recursive=False,
+        )
+        observer.daemon = True
+        observer.start()
+        watcher._observer = observer
+        logger.info("Watching %s for proposal changes", directory)
+        return watcher
+
+    def fileno(self) -> int:
+        return self._wake_r
+
+    def drain(self) -> set[Path]:
+        """Return and clear the set of paths changed since the last drain."""
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        with self._lock:
+            pending, self._pending = self._pending, set()
+        return pending
+
+    def stop(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+
+    def _push(self, path: Path) -> None:
+        if not path.match(PROPOSAL_PATTERN):
+            return
+        with self._lock:
+            self._pending.add(path)
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            pass  # pipe already full — the loop is going to wake anyway
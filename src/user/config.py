@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 from typing import Any
@@ -10,6 +11,9 @@ import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 
+# Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _find_config_file() -> Path | None:
     """Locate default.yaml relative to the package or project root."""
@@ -20,7 +24,13 @@ def _find_config_file() -> Path | None:
         if p.is_file():
             return p
 
-    # Walk up from this file to find config/default.yaml (or .example fallback)
+    # Package-relative lookup; cached since the tree does not move at runtime
+    return _find_default_config()
+
+
+@functools.lru_cache(maxsize=1)
+def _find_default_config() -> Path | None:
+    """Walk up from this file to find config/default.yaml (or .example fallback)."""
     current = Path(__file__).resolve().parent
     for _ in range(5):
         for parent in (current, current.parent):
@@ -35,6 +45,8 @@ def _find_config_file() -> Path | None:
 class LLMEndpoint(BaseModel):
     """A single LLM endpoint configuration."""
 
+    model_config = {"defer_build": True}
+
     name: str
     base_url: str
     model: str
@@ -48,6 +60,8 @@ class LLMEndpoint(BaseModel):
 class VoiceConfig(BaseModel):
     """Voice channel configuration."""
 
+    model_config = {"defer_build": True}
+
     enabled: bool = False
     wake_word_engine: str = "vosk"
     stt_engine: str = "vosk"
@@ -60,6 +74,8 @@ class VoiceConfig(BaseModel):
 class SafetyConfig(BaseModel):
     """Safety guardrail configuration."""
 
+    model_config = {"defer_build": True}
+
     blocklist_file: str = ""
     max_input_length: int = 4096
     max_output_length: int = 4096
@@ -69,6 +85,8 @@ class SafetyConfig(BaseModel):
 class MemoryConfig(BaseModel):
     """Memory system configuration."""
 
+    model_config = {"defer_build": True}
+
     backend: str = "keyword"  # "keyword" or "faiss"
     max_facts_per_profile: int = 10000
     retrieval_top_k: int = 5
@@ -79,6 +97,8 @@ class MemoryConfig(BaseModel):
 class SkillsConfig(BaseModel):
     """Skill system configuration."""
 
+    model_config = {"defer_build": True}
+
     auto_propose: bool = True  # auto-propose for explicit requests; ask first for implicit gaps
 
 
@@ -91,7 +111,9 @@ class Settings(BaseSettings):
       3. Field defaults
     """
 
-    model_config = {"env_prefix": "CLAWLESS_"}
+    # defer_build: build validators on first use, not at import (admin commands
+    # import this module for config lookups without ever loading Settings)
+    model_config = {"env_prefix": "CLAWLESS_", "defer_build": True}
 
     # Paths
     data_dir: str = Field(default="./data", description="Root data directory for all writable state")
@@ -131,7 +153,7 @@ def load_yaml_config(path: Path | None = None) -> dict[str, Any]:
     if path is None or not path.is_file():
         return {}
     with open(path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YAML_LOADER)
     return data if isinstance(data, dict) else {}
 
 
@@ -163,7 +185,7 @@ def load_system_profile(
         )
 
     with open(profile_path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YAML_LOADER)
 
     if not isinstance(data, dict):
         return SystemProfile(
@@ -180,6 +202,7 @@ def load_system_profile(
     )
 
 
+@functools.lru_cache(maxsize=32)
 def _find_config_sibling(filename: str) -> Path | None:
     """Find a file in the config/ directory near this package."""
     current = Path(__file__).resolve().parent
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
+import unicodedata
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +36,17 @@ _INJECTION_PATTERNS = [
     r"(?:system|developer) (?:prompt|message|instruction)",
 ]
 
+# All injection patterns as one alternation: a single search per input
+_INJECTION_RE = re.compile("|".join(f"(?:{p})" for p in _INJECTION_PATTERNS), re.IGNORECASE)
+
+# Every injection pattern contains one of these literals (lowercase); folded
+# text without any of them skips the regex search. Keep in sync with the patterns.
+_INJECTION_KEYWORDS = (
+    "ignore", "you are now", "forget", "disregard", "override", "your new",
+    "your real", "act as", "pretend", "jailbreak", "do anything now",
+    "system ", "developer ",
+)
+
 
 # Default persona (used when no persona.md is provided)
 _DEFAULT_PERSONA = "You are a helpful, safe, and honest assistant."
@@ -60,11 +74,14 @@ class SafetyGuard:
         self._max_input_length = max_input_length
         self._max_output_length = max_output_length
         self._blocklist: set[str] = set()
-        self._injection_res = [re.compile(p, re.IGNORECASE) for p in _INJECTION_PATTERNS]
 
         if blocklist_path:
             self._load_blocklist(Path(blocklist_path))
 
+        # Blocklist terms and injection phrases in one Aho-Corasick automaton
+        # (optional pyahocorasick); see _scan
+        self._automaton = _build_automaton(self._blocklist | _injection_phrases())
+
     def check_input(self, text: str) -> GuardResult:
         """Check user input for safety violations."""
         # Length check
@@ -78,13 +95,11 @@ class SafetyGuard:
         if not text.strip():
             return GuardResult(allowed=False, reason="Empty input")
 
-        # Blocklist check
-        blocked = self._check_blocklist(text)
+        # Blocklist and prompt injection checks
+        blocked, injection = self._scan(text, injection=True)
         if blocked:
             return GuardResult(allowed=False, reason=f"Input contains blocked term: '{blocked}'")
 
-        # Prompt injection check
-        injection = self._check_injection(text)
         if injection:
             logger.warning("Prompt injection attempt detected: %s", injection)
             return GuardResult(allowed=False, reason="Input appears to contain a prompt injection")
@@ -99,7 +114,7 @@ class SafetyGuard:
                 reason=f"Output exceeds maximum length ({len(text)} > {self._max_output_length})",
             )
 
-        blocked = self._check_blocklist(text)
+        blocked, _ = self._scan(text, injection=False)
         if blocked:
             return GuardResult(allowed=False, reason=f"Output contains blocked term: '{blocked}'")
 
@@ -121,33 +136,85 @@ class SafetyGuard:
           4. User memories (facts/preferences)
           5. Skill descriptions
         """
+        static = self.build_system_prompt_static(persona, persona_memories, skill_descriptions)
+        return self.combine_system_prompt(static, memory_context)
+
+    def build_system_prompt_static(
+        self,
+        persona: str = "",
+        persona_memories: str = "",
+        skill_descriptions: str = "",
+    ) -> tuple[str, str]:
+        """Build the parts of the system prompt that do not depend on the query.
+
+        Returns the (head, tail) sections that surround the per-turn memory
+        context; callers can cache them and pass them to combine_system_prompt.
+        """
         sections = [
             persona.strip() if persona.strip() else _DEFAULT_PERSONA,
         ]
         if persona_memories.strip():
             sections.append(persona_memories.strip())
         sections.append(_SAFETY_RULES)
+        return "\n\n".join(sections), skill_descriptions.strip()
+
+    @staticmethod
+    def combine_system_prompt(static: tuple[str, str], memory_context: str = "") -> str:
+        """Splice the per-turn memory context into a prebuilt (head, tail) prompt."""
+        head, tail = static
+        sections = [head]
         if memory_context.strip():
             sections.append(memory_context.strip())
-        if skill_descriptions.strip():
-            sections.append(skill_descriptions.strip())
+        if tail:
+            sections.append(tail)
         return "\n\n".join(sections)
 
-    def _check_blocklist(self, text: str) -> str | None:
-        """Return the first blocked term found, or None."""
-        text_lower = text.lower()
+    def _scan(self, text: str, injection: bool) -> tuple[str | None, str | None]:
+        """Return (blocked term, injection phrase) found in text, either may be None.
+
+        The injection check is skipped unless ``injection`` is set, and a
+        blocked term takes precedence. Matching runs on the folded text (see
+        _fold), so case and compatibility lookalikes such as ``ſ`` or ``İ``
+        cannot slip past the lowercase terms. For non-ASCII text the
+        case-insensitive regex also runs on the original text, so nothing
+        re.IGNORECASE would catch is missed.
+        """
+        if not injection and not self._blocklist:
+            return None, None
+        blocked, found_injection = self._scan_folded(_fold(text), injection)
+        if blocked or found_injection or not injection or text.isascii():
+            return blocked, found_injection
+        match = _INJECTION_RE.search(text)
+        return None, match.group(0) if match else None
+
+    def _scan_folded(self, text_lower: str, injection: bool) -> tuple[str | None, str | None]:
+        """Scan folded text; with the automaton this is one pass for both checks."""
+        if self._automaton is None:
+            blocked = self._check_blocklist(text_lower)
+            if blocked or not injection:
+                return blocked, None
+            return None, self._check_injection(text_lower)
+        found_injection = None
+        for _end, phrase in self._automaton.iter(text_lower):
+            if phrase in self._blocklist:
+                return phrase, None
+            if injection and found_injection is None:
+                found_injection = phrase
+        return None, found_injection
+
+    def _check_blocklist(self, text_lower: str) -> str | None:
+        """Return the first blocked term found in folded text, or None."""
         for term in self._blocklist:
             if term in text_lower:
                 return term
         return None
 
-    def _check_injection(self, text: str) -> str | None:
-        """Return the matched injection pattern, or None."""
-        for pattern in self._injection_res:
-            match = pattern.search(text)
-            if match:
-                return match.group(0)
-        return None
+    def _check_injection(self, text_lower: str) -> str | None:
+        """Return the injection phrase matched in folded text, or None."""
+        if not any(keyword in text_lower for keyword in _INJECTION_KEYWORDS):
+            return None
+        match = _INJECTION_RE.search(text_lower)
+        return match.group(0) if match else None
 
     def _load_blocklist(self, path: Path) -> None:
         """Load blocked terms from a file (one term per line)."""
@@ -155,7 +222,80 @@ class SafetyGuard:
             logger.warning("Blocklist file not found: %s", path)
             return
         for line in path.read_text(encoding="utf-8").splitlines():
-            term = line.strip().lower()
+            term = _fold(line.strip())
             if term and not term.startswith("#"):
                 self._blocklist.add(term)
         logger.info("Loaded %d blocklist terms from %s", len(self._blocklist), path)
+
+
+def _fold(text: str) -> str:
+    """Fold text for case-insensitive matching against lowercase terms.
+
+    ASCII text is just lowercased. Otherwise NFKD splits compatibility and
+    accented characters into base characters plus combining marks; the marks
+    are dropped and the rest casefolded (``ſ`` → ``s``, ``İ`` → ``i``).
+    """
+    if text.isascii():
+        return text.lower()
+    folded = unicodedata.normalize("NFKD", unicodedata.normalize("NFKD", text).casefold())
+    return "".join(c for c in folded if not unicodedata.combining(c))
+
+
+@functools.cache
+def _injection_phrases() -> frozenset[str]:
+    """Every literal phrase matched by _INJECTION_PATTERNS, lowercased."""
+    phrases: set[str] = set()
+    for pattern in _INJECTION_PATTERNS:
+        phrases.update(_expand_pattern(pattern))
+    return frozenset(phrases)
+
+
+def _expand_pattern(pattern: str) -> list[str]:
+    """Expand a pattern of literals, ``(?:a|b)`` groups and ``?`` into its strings.
+
+    Raises ValueError on any other regex syntax.
+    """
+
+    def parse_alternation(i: int) -> tuple[list[str], int]:
+        options, i = parse_sequence(i)
+        while i < len(pattern) and pattern[i] == "|":
+            more, i = parse_sequence(i + 1)
+            options += more
+        return options, i
+
+    def parse_sequence(i: int) -> tuple[list[str], int]:
+        results = [""]
+        while i < len(pattern) and pattern[i] not in "|)":
+            if pattern.startswith("(?:", i):
+                items, i = parse_alternation(i + 3)
+                if i >= len(pattern) or pattern[i] != ")":
+                    raise ValueError(f"Unbalanced group in pattern: {pattern!r}")
+                i += 1
+            elif pattern[i] in "\\.^$*+?{}[](":
+                raise ValueError(f"Unsupported syntax in pattern: {pattern!r}")
+            else:
+                items, i = [pattern[i].lower()], i + 1
+            if i < len(pattern) and pattern[i] == "?":
+                items, i = items + [""], i + 1
+            results = [head + tail for head in results for tail in items]
+        return results, i
+
+    strings, end = parse_alternation(0)
+    if end != len(pattern):
+        raise ValueError(f"Unbalanced group in pattern: {pattern!r}")
+    return strings
+
+
+def _build_automaton(terms: set[str] | frozenset[str]) -> Any | None:
+    """Compile terms into a pyahocorasick automaton, or None if unavailable."""
+    if not terms:
+        return None
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
@@ -11,7 +11,7 @@ import logging
 from pathlib import Path
 
 from clawless.user.llm import LLMRouter
-from clawless.user.skills.base import BaseSkill, SkillRegistry
+from clawless.user.skills.base import BaseSkill, BaseTool, SkillRegistry
 from clawless.user.types import Event, KernelContext, SkillResult, SystemProfile
 
 logger = logging.getLogger(__name__)
@@ -52,10 +52,15 @@ class Kernel:
         self._system_profile = system_profile
         self._data_dir = data_dir
         self._ctx: KernelContext | None = None
+        # Built at boot from the frozen registry; see _index_skills
+        self._handlers: dict[str, tuple[BaseSkill, ...]] = {}
+        self._capabilities: dict[str, frozenset[str]] = {}
+        self._tools: dict[str, BaseTool] = {}
 
     def boot(self) -> None:
         """Freeze registry, validate, initialize skills, and run the driver."""
         self._registry.freeze()
+        self._index_skills()
 
         # Validate: must have a driver skill
         driver = self._registry.find_driver()
@@ -101,8 +106,8 @@ class Kernel:
         # Capability enforcement on the dispatching skill
         required_cap = _EVENT_CAPABILITIES.get(event.type)
         if required_cap:
-            source_skill = self._registry.get(event.source)
-            if source_skill and required_cap not in source_skill.capabilities:
+            source_caps = self._capabilities.get(event.source)
+            if source_caps is not None and required_cap not in source_caps:
                 logger.warning(
                     "Skill '%s' tried to dispatch '%s' without capability '%s' — blocked",
                     event.source,
@@ -112,8 +117,7 @@ class Kernel:
                 return SkillResult(success=False, output=f"Missing capability: {required_cap}")
 
         # Route to handlers
-        handlers = self._registry.find_by_event(event.type)
-        for skill in handlers:
+        for skill in self._handlers.get(event.type, ()):
             if skill.name == event.source:
                 continue  # don't send events back to the source
             try:
@@ -125,6 +129,22 @@ class Kernel:
 
         return None
 
+    def _index_skills(self) -> None:
+        """Snapshot event handlers, capabilities and tools from the frozen registry.
+
+        Skills expose both as properties that build a new collection on every
+        access; the registry cannot change after freeze(), so dispatch() reads
+        these snapshots instead.
+        """
+        handlers: dict[str, list[BaseSkill]] = {}
+        for skill in self._registry.skills.values():
+            self._capabilities[skill.name] = frozenset(skill.capabilities)
+            for event_type in skill.handles_events:
+                handlers.setdefault(event_type, []).append(skill)
+        self._handlers = {event_type: tuple(skills) for event_type, skills in handlers.items()}
+        for tool in self._registry.all_tools:
+            self._tools.setdefault(tool.name, tool)  # first registered wins
+
     def _build_tool_schemas(self) -> tuple[dict, ...]:
         """Convert all BaseTool instances from the registry to LLM tool-calling format."""
         schemas = []
@@ -146,14 +166,14 @@ class Kernel:
 
     def _call_tool(self, name: str, arguments: dict) -> str:
         """Execute a registered tool by name."""
-        for tool in self._registry.all_tools:
-            if tool.name == name:
-                try:
-                    return tool.execute(**arguments)
-                except Exception as e:
-                    logger.exception("Tool '%s' failed", name)
-                    return f"Tool error: {e}"
-        return f"Unknown tool: {name}"
+        tool = self._tools.get(name)
+        if tool is None:
+            return f"Unknown tool: {name}"
+        try:
+            return tool.execute(**arguments)
+        except Exception as e:
+            logger.exception("Tool '%s' failed", name)
+            return f"Tool error: {e}"
 
     def _shutdown(self) -> None:
         """Call on_unload on all skills."""
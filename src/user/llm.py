@@ -13,7 +13,10 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -23,6 +26,35 @@ from clawless.user.config import LLMEndpoint
 
 logger = logging.getLogger(__name__)
 
+# A dead endpoint should fail fast at connect time rather than after the
+# endpoint's full (read) timeout
+_CONNECT_TIMEOUT = 5.0
+
+# Seconds an unavailable provider is moved behind the healthy ones in
+# LLMRouter.chat; see _is_unavailable
+_FAILURE_COOLDOWN = 60.0
+
+try:  # optional speedup (``speedups`` extra); same JSON, faster
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes (orjson-compatible fallback)."""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class ProviderHTTPError(RuntimeError):
+    """A provider endpoint answered with a non-success HTTP status."""
+
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
 
 @dataclass
 class LLMResponse:
@@ -65,14 +97,41 @@ class OpenAICompatibleProvider(LLMProvider):
     LocalAI, LM Studio, text-generation-webui, and many more.
     """
 
-    def __init__(self, endpoint: LLMEndpoint) -> None:
+    def __init__(
+        self,
+        endpoint: LLMEndpoint,
+        client_factory: Callable[[], httpx.Client] | None = None,
+    ) -> None:
         self._endpoint = endpoint
-        self._client = httpx.Client(timeout=endpoint.timeout)
+        # A client from client_factory is shared and owned by the caller (see
+        # LLMRouter); without one the provider creates and closes its own
+        self._client_factory = client_factory
+        self._http: httpx.Client | None = None
+
+        # Fixed for the endpoint's lifetime: resolved once, not per request
+        self._timeout = httpx.Timeout(
+            endpoint.timeout, connect=min(_CONNECT_TIMEOUT, endpoint.timeout)
+        )
+        self._url = f"{endpoint.base_url.rstrip('/')}/chat/completions"
+        self._headers: dict[str, str] = {"Content-Type": "application/json"}
+        api_key = self._resolve_api_key()
+        if api_key:
+            self._headers["Authorization"] = f"Bearer {api_key}"
 
     @property
     def name(self) -> str:
         return self._endpoint.name
 
+    @property
+    def _client(self) -> httpx.Client:
+        # Created on first request: lower-priority fallbacks are often never used
+        if self._http is None:
+            if self._client_factory is not None:
+                self._http = self._client_factory()
+            else:
+                self._http = httpx.Client(timeout=self._timeout)
+        return self._http
+
     def chat(
         self,
         messages: list[dict[str, str]],
@@ -80,12 +139,7 @@ class OpenAICompatibleProvider(LLMProvider):
         temperature: float = 0.7,
         **kwargs: Any,
     ) -> LLMResponse:
-        url = f"{self._endpoint.base_url.rstrip('/')}/chat/completions"
-        api_key = self._resolve_api_key()
-
-        headers: dict[str, str] = {"Content-Type": "application/json"}
-        if api_key:
-            headers["Authorization"] = f"Bearer {api_key}"
+        url = self._url
 
         payload: dict[str, Any] = {
             "model": self._endpoint.model,
@@ -95,14 +149,21 @@ class OpenAICompatibleProvider(LLMProvider):
         }
         payload.update(kwargs)
 
-        response = self._client.post(url, json=payload, headers=headers)
+        response = self._client.post(
+            url,
+            content=_json_dumps(payload),
+            headers=self._headers,
+            timeout=self._timeout,
+        )
         if not response.is_success:
             try:
-                err_body = response.json()
+                err_body = _json_loads(response.content)
             except Exception:
                 err_body = response.text
-            raise RuntimeError(f"{response.status_code} from {url}: {err_body}")
-        data = response.json()
+            raise ProviderHTTPError(
+                response.status_code, f"{response.status_code} from {url}: {err_body}"
+            )
+        data = _json_loads(response.content)
 
         content = ""
         tool_calls = []
@@ -130,7 +191,9 @@ class OpenAICompatibleProvider(LLMProvider):
         return key
 
     def close(self) -> None:
-        self._client.close()
+        if self._client_factory is None and self._http is not None:
+            self._http.close()
+        self._http = None
 
 
 class AnthropicProvider(LLMProvider):
@@ -145,14 +208,42 @@ class AnthropicProvider(LLMProvider):
 
     API_VERSION = "2023-06-01"
 
-    def __init__(self, endpoint: LLMEndpoint) -> None:
+    def __init__(
+        self,
+        endpoint: LLMEndpoint,
+        client_factory: Callable[[], httpx.Client] | None = None,
+    ) -> None:
         self._endpoint = endpoint
-        self._client = httpx.Client(timeout=endpoint.timeout)
+        # A client from client_factory is shared and owned by the caller (see
+        # LLMRouter); without one the provider creates and closes its own
+        self._client_factory = client_factory
+        self._http: httpx.Client | None = None
+
+        # Fixed for the endpoint's lifetime: resolved once, not per request
+        self._timeout = httpx.Timeout(
+            endpoint.timeout, connect=min(_CONNECT_TIMEOUT, endpoint.timeout)
+        )
+        self._url = f"{endpoint.base_url.rstrip('/')}/v1/messages"
+        self._headers: dict[str, str] = {
+            "Content-Type": "application/json",
+            "x-api-key": self._resolve_api_key(),
+            "anthropic-version": self.API_VERSION,
+        }
 
     @property
     def name(self) -> str:
         return self._endpoint.name
 
+    @property
+    def _client(self) -> httpx.Client:
+        # Created on first request: lower-priority fallbacks are often never used
+        if self._http is None:
+            if self._client_factory is not None:
+                self._http = self._client_factory()
+            else:
+                self._http = httpx.Client(timeout=self._timeout)
+        return self._http
+
     def chat(
         self,
         messages: list[dict[str, str]],
@@ -160,15 +251,7 @@ class AnthropicProvider(LLMProvider):
         temperature: float = 0.7,
         **kwargs: Any,
     ) -> LLMResponse:
-        url = f"{self._endpoint.base_url.rstrip('/')}/v1/messages"
-        api_key = self._resolve_api_key()
-
-        headers: dict[str, str] = {
-            "Content-Type": "application/json",
-            "x-api-key": api_key,
-            "anthropic-version": self.API_VERSION,
-        }
-
+        url = self._url
         # Anthropic: system message goes in a separate top-level field
         system_text = ""
         chat_messages = []
@@ -197,7 +280,7 @@ class AnthropicProvider(LLMProvider):
                         "type": "tool_use",
                         "id": tc.get("id", ""),
                         "name": func.get("name", ""),
-                        "input": json.loads(args) if isinstance(args, str) else args,
+                        "input": _json_loads(args) if isinstance(args, str) else args,
                     })
                 chat_messages.append({"role": "assistant", "content": blocks})
             else:
@@ -227,14 +310,21 @@ class AnthropicProvider(LLMProvider):
             payload["tools"] = anthropic_tools
         payload.update(kwargs)
 
-        response = self._client.post(url, json=payload, headers=headers)
+        response = self._client.post(
+            url,
+            content=_json_dumps(payload),
+            headers=self._headers,
+            timeout=self._timeout,
+        )
         if not response.is_success:
             try:
-                err_body = response.json()
+                err_body = _json_loads(response.content)
             except Exception:
                 err_body = response.text
-            raise RuntimeError(f"{response.status_code} from {url}: {err_body}")
-        data = response.json()
+            raise ProviderHTTPError(
+                response.status_code, f"{response.status_code} from {url}: {err_body}"
+            )
+        data = _json_loads(response.content)
 
         # Anthropic response: content is a list of blocks
         content = ""
@@ -248,7 +338,7 @@ class AnthropicProvider(LLMProvider):
                     "type": "function",
                     "function": {
                         "name": block.get("name", ""),
-                        "arguments": json.dumps(block.get("input", {})),
+                        "arguments": _json_dumps(block.get("input", {})).decode("utf-8"),
                     },
                 })
 
@@ -270,7 +360,9 @@ class AnthropicProvider(LLMProvider):
         return key
 
     def close(self) -> None:
-        self._client.close()
+        if self._client_factory is None and self._http is not None:
+            self._http.close()
+        self._http = None
 
 
 _PROVIDER_MAP: dict[str, type[LLMProvider]] = {
@@ -283,11 +375,20 @@ class LLMRouter:
     """Routes LLM requests to configured providers with priority-based fallback.
 
     Providers are tried in priority order (lowest number first).
-    If a provider fails, the next one is attempted.
+    If a provider fails, the next one is attempted. A provider that was
+    unreachable or erroring server-side within the last ``_FAILURE_COOLDOWN``
+    seconds is tried after the healthy ones, so a dead primary does not add
+    its timeout to every request.
     """
 
     def __init__(self) -> None:
         self._providers: list[tuple[int, LLMProvider]] = []
+        # Connection pool shared by the providers created via add_endpoint,
+        # created on their first request; see _shared_client
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        # Provider name → monotonic time until which it is demoted
+        self._cooldown_until: dict[str, float] = {}
 
     @property
     def provider_count(self) -> int:
@@ -311,9 +412,26 @@ class LLMRouter:
                 f"Unknown provider '{endpoint.provider}' for endpoint '{endpoint.name}'. "
                 f"Supported: {', '.join(_PROVIDER_MAP)}"
             )
-        provider = provider_cls(endpoint)
+        provider = provider_cls(endpoint, client_factory=self._shared_client)
         self.add_provider(provider, endpoint.priority)
 
+    def _shared_client(self) -> httpx.Client:
+        """Return the pooled client shared by add_endpoint providers, creating it once."""
+        # Providers may make their first request from different threads (the
+        # conversation and the reasoning skill's memory worker)
+        client = self._client
+        if client is None:
+            with self._client_lock:
+                client = self._client
+                if client is None:
+                    client = self._client = httpx.Client(
+                        limits=httpx.Limits(
+                            max_connections=64, max_keepalive_connections=32,
+                            keepalive_expiry=30,
+                        ),
+                    )
+        return client
+
     def chat(
         self,
         messages: list[dict[str, str]],
@@ -331,8 +449,15 @@ class LLMRouter:
                 "Add at least one endpoint in config/default.yaml or via CLAWLESS_ env vars."
             )
 
+        # Stable sort: healthy providers first, each group in priority order
+        now = time.monotonic()
+        providers = sorted(
+            self._providers,
+            key=lambda p: self._cooldown_until.get(p[1].name, 0.0) > now,
+        )
+
         errors: list[str] = []
-        for priority, provider in self._providers:
+        for priority, provider in providers:
             try:
                 logger.debug("Trying LLM provider '%s' (priority %d)", provider.name, priority)
                 response = provider.chat(
@@ -342,11 +467,14 @@ class LLMRouter:
                     **kwargs,
                 )
                 logger.debug("Got response from '%s' (%d tokens)", provider.name, len(response.content))
+                self._cooldown_until.pop(provider.name, None)
                 return response
             except Exception as e:
                 error_msg = f"{provider.name}: {type(e).__name__}: {e}"
                 errors.append(error_msg)
                 logger.warning("Provider '%s' failed: %s", provider.name, e)
+                if _is_unavailable(e):
+                    self._cooldown_until[provider.name] = time.monotonic() + _FAILURE_COOLDOWN
 
         raise RuntimeError(
             f"All {len(self._providers)} LLM providers failed:\n" + "\n".join(errors)
@@ -357,3 +485,21 @@ class LLMRouter:
         for _, provider in self._providers:
             if hasattr(provider, "close"):
                 provider.close()
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+
+def _is_unavailable(error: Exception) -> bool:
+    """Whether a provider error means the endpoint itself is down or overloaded.
+
+    Connection failures, timeouts, 5xx and 429 count; other 4xx responses are
+    specific to the request (e.g. context too long) and say nothing about the
+    endpoint's health.
+    """
+    if isinstance(error, httpx.TransportError):
+        return True
+    if isinstance(error, ProviderHTTPError):
+        return error.status_code >= 500 or error.status_code == 429
+    return False
@@ -10,11 +10,9 @@ import logging
 import sys
 from pathlib import Path
 
-from clawless.user.config import load_settings, load_system_profile
-from clawless.user.kernel import Kernel
-from clawless.user.llm import LLMRouter
-from clawless.user.sandbox import ensure_profile_dirs, ensure_proposals_dir
-from clawless.user.skills.base import SkillRegistry
+# The kernel, settings, LLM router and skill registry (and with them pydantic,
+# httpx and yaml) are imported inside main() so --help and argparse errors
+# return without loading them.
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -62,6 +60,12 @@ def setup_logging(level: str) -> None:
 def main(argv: list[str] | None = None) -> None:
     args = parse_args(argv)
 
+    from clawless.user.config import _find_config_sibling, load_settings, load_system_profile
+    from clawless.user.kernel import Kernel
+    from clawless.user.llm import LLMRouter
+    from clawless.user.sandbox import ensure_profile_dirs, ensure_proposals_dir
+    from clawless.user.skills.base import SkillRegistry
+
     # Load config
     config_path = Path(args.config) if args.config else None
     settings = load_settings(config_path)
@@ -101,8 +105,6 @@ def main(argv: list[str] | None = None) -> None:
     manifest_path = Path(settings.skills_dir) / "skills_manifest.yaml" if settings.skills_dir else None
     if manifest_path is None:
         # Auto-detect manifest in config/ directory
-        from clawless.user.config import _find_config_sibling
-
         manifest_path = _find_config_sibling("skills_manifest.yaml")
     if manifest_path:
         registry.load_from_manifest(manifest_path)
@@ -6,8 +6,11 @@ This is the primary enforcement layer for Security Invariant #1.
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 from pathlib import Path
+from typing import BinaryIO
 
 
 class PathViolationError(Exception):
@@ -47,7 +50,7 @@ def resolve_safe_write_path(data_dir: Path, relative_path: str | Path) -> Path:
     Raises:
         PathViolationError: If the resolved path escapes the data directory.
     """
-    data_root = Path(data_dir).resolve()
+    data_root = _resolve_data_root(Path(data_dir))
     target = (data_root / relative_path).resolve()
 
     # The resolved target must be under the data root
@@ -57,13 +60,8 @@ def resolve_safe_write_path(data_dir: Path, relative_path: str | Path) -> Path:
         )
 
     # The first subdirectory must be in the allowed set
-    try:
-        rel = target.relative_to(data_root)
-        top_dir = rel.parts[0] if rel.parts else ""
-    except ValueError:
-        raise PathViolationError(
-            f"Write target '{target}' is outside data directory '{data_root}'"
-        )
+    rel = str(target)[len(str(data_root)) :].lstrip(os.sep)
+    top_dir = rel.split(os.sep, 1)[0]
 
     if top_dir not in _ALLOWED_WRITE_SUBDIRS:
         raise PathViolationError(
@@ -141,15 +139,39 @@ def safe_append_file(data_dir: Path, relative_path: str | Path, content: str) ->
     return target
 
 
+def open_safe_append(data_dir: Path, relative_path: str | Path) -> BinaryIO:
+    """Open a file for binary appending within the data directory, with full path validation.
+
+    The path is validated when the file is opened; the caller owns the returned
+    handle and must close it.
+    """
+    target = resolve_safe_write_path(data_dir, relative_path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    return open(target, "ab")
+
+
 def safe_read_file(path: Path) -> str:
     """Read a file. No path restrictions on reads — only writes are sandboxed."""
     return path.read_text(encoding="utf-8")
 
 
+def _resolve_data_root(data_dir: Path) -> Path:
+    """Resolve the data root, memoizing absolute roots (they do not depend on cwd)."""
+    if data_dir.is_absolute():
+        return _resolve_absolute_root(data_dir)
+    return data_dir.resolve()
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_absolute_root(data_dir: Path) -> Path:
+    # Resolved once per process: if a component is later swapped for a
+    # symlink, targets are still checked against the original location.
+    return data_dir.resolve()
+
+
 def _is_path_under(path: Path, parent: Path) -> bool:
     """Check if path is equal to or a descendant of parent (both must be resolved)."""
-    try:
-        path.relative_to(parent)
+    path_str, parent_str = str(path), str(parent)
+    if path_str == parent_str:
         return True
-    except ValueError:
-        return False
+    return path_str.startswith(parent_str.rstrip(os.sep) + os.sep)
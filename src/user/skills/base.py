@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import importlib
 import logging
+import re
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
@@ -134,6 +135,8 @@ class SkillRegistry:
     def __init__(self) -> None:
         self._skills: dict[str, BaseSkill] = {}
         self._frozen = False
+        # (trigger pattern, phrase → skill names); built lazily, see find_by_trigger
+        self._trigger_index: tuple[re.Pattern[str] | None, dict[str, frozenset[str]]] | None = None
 
     @property
     def skills(self) -> dict[str, BaseSkill]:
@@ -164,6 +167,7 @@ class SkillRegistry:
             logger.warning("Skill '%s' already registered, skipping duplicate", skill.name)
             return
         self._skills[skill.name] = skill
+        self._trigger_index = None
         logger.info("Registered skill: %s", skill.name)
 
     def get(self, name: str) -> BaseSkill | None:
@@ -174,15 +178,41 @@ class SkillRegistry:
         return [s for s in self._skills.values() if event_type in s.handles_events]
 
     def find_by_trigger(self, text: str) -> list[BaseSkill]:
-        """Find skills whose trigger phrases match the input text."""
-        text_lower = text.lower()
-        matches = []
-        for skill in self._skills.values():
+        """Find skills whose trigger phrases match the input text.
+
+        All phrases are matched in a single pass over the lowercased text
+        using one compiled alternation instead of a substring test per phrase.
+        """
+        if self._trigger_index is None:
+            self._trigger_index = self._build_trigger_index()
+        pattern, owners = self._trigger_index
+        if pattern is None:
+            return []
+        found: set[str] = set()
+        for match in pattern.finditer(text.lower()):
+            found.update(owners[match.group(1)])
+        return [skill for name, skill in self._skills.items() if name in found]
+
+    def _build_trigger_index(self) -> tuple[re.Pattern[str] | None, dict[str, frozenset[str]]]:
+        """Compile every skill's trigger phrases into one lookahead alternation."""
+        owners: dict[str, set[str]] = {}
+        for name, skill in self._skills.items():
             for phrase in skill.trigger_phrases:
-                if phrase.lower() in text_lower:
-                    matches.append(skill)
-                    break
-        return matches
+                owners.setdefault(phrase.lower(), set()).add(name)
+        if not owners:
+            return None, {}
+        # Longest first, so at each position the lookahead reports the longest
+        # phrase starting there. Any shorter phrase occurring at the same
+        # position is a prefix of it, so fold prefix owners into each phrase.
+        phrases = sorted(owners, key=len, reverse=True)
+        closure = {
+            phrase: frozenset().union(
+                *(names for prefix, names in owners.items() if phrase.startswith(prefix))
+            )
+            for phrase in phrases
+        }
+        pattern = re.compile("(?=(" + "|".join(map(re.escape, phrases)) + "))")
+        return pattern, closure
 
     def find_driver(self) -> BaseSkill | None:
         """Find the skill with user:input capability (the primary interaction driver)."""
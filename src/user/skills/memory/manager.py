@@ -7,23 +7,50 @@ FAISS backend for semantic search on capable hardware.
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
+import os
 import re
+import threading
 from collections import Counter
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import BinaryIO
 
 from clawless.user.types import MemoryEntry
 from clawless.user.sandbox import (
     ensure_profile_dirs,
-    safe_append_file,
+    open_safe_append,
     validate_profile_id,
 )
 
 logger = logging.getLogger(__name__)
 
+# Word separators for _tokenize (str patterns are Unicode-aware by default)
+_WORD_SPLIT_RE = re.compile(r"[^\w]+")
+# ASCII fast path for _tokenize: map every ASCII non-word character to a space
+_ASCII_SEPARATORS = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")}
+)
+
+try:  # optional speedup (``speedups`` extra); same JSON, faster
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _dump_line(record: dict) -> bytes:
+        """Serialize a record as one UTF-8 JSONL line."""
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _dump_line(record: dict) -> bytes:
+        """Serialize a record as one UTF-8 JSONL line."""
+        return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
 
 class MemoryManager:
     """Manages per-profile memory storage and retrieval."""
@@ -39,6 +66,22 @@ class MemoryManager:
 
         # Cache of loaded entries (lazy-loaded)
         self._entries: list[MemoryEntry] | None = None
+        # Inverted index over _entries: token → indices of the entries whose
+        # content or keywords contain it (built lazily by retrieve)
+        self._token_index: dict[str, list[int]] | None = None
+        # Per-entry scoring inputs, parallel to _entries and built with the
+        # index: (content token counts, keyword tokens)
+        self._entry_terms: list[tuple[Counter[str], set[str]]] = []
+        # Bytes of the JSONL file that _entries reflects; see store()
+        self._loaded_size = 0
+        # Append handle for entries.jsonl, opened on the first store()
+        self._append_fh: BinaryIO | None = None
+        # Set by close(); later stores are dropped rather than reopening the file
+        self._closed = False
+        # store() runs on the reasoning skill's background worker while
+        # retrieve() runs on the conversation thread: the entry cache, index
+        # and scoring inputs above only change (and are only read) under it
+        self._lock = threading.RLock()
 
     @property
     def _memory_file(self) -> str:
@@ -59,13 +102,45 @@ class MemoryManager:
             "metadata": entry.metadata,
             "keywords": entry.keywords,
         }
-        line = json.dumps(record, ensure_ascii=False) + "\n"
-        safe_append_file(self._data_dir, self._memory_file, line)
-
-        # Invalidate cache
-        self._entries = None
+        line = _dump_line(record)
+        with self._lock:
+            if self._closed:
+                logger.warning(
+                    "Dropping %s memory entry for profile %s: store is closed",
+                    entry.type, self._profile_id,
+                )
+                return
+            if self._append_fh is None:
+                self._append_fh = open_safe_append(self._data_dir, self._memory_file)
+            self._append_fh.write(line)
+            self._append_fh.flush()
+
+            # If the file grew by exactly our line, nobody else wrote to it since it
+            # was loaded: extend the caches in place instead of forcing a full reload
+            if self._entries is not None and (
+                os.fstat(self._append_fh.fileno()).st_size
+                == self._loaded_size + len(line)
+            ):
+                self._entries.append(entry)
+                self._loaded_size += len(line)
+                if self._token_index is not None:
+                    self._entry_terms.append(
+                        _index_entry(self._token_index, len(self._entries) - 1, entry)
+                    )
+            else:
+                # Invalidate cache
+                self._entries = None
+                self._token_index = None
         logger.debug("Stored %s memory entry for profile %s", entry.type, self._profile_id)
 
+    def close(self) -> None:
+        """Close the append handle, if open. Later stores are dropped."""
+        with self._lock:
+            self._closed = True
+            if self._append_fh is not None:
+                self._append_fh.close()
+                self._append_fh = None
+
     def store_fact(self, content: str, source: str = "extracted", confidence: float = 1.0) -> None:
         """Convenience method to store a fact."""
         self.store(MemoryEntry(type="fact", content=content, source=source, confidence=confidence))
@@ -93,32 +168,39 @@ class MemoryManager:
         keywords. This enables cross-language retrieval: a German query can
         match an English-stored memory via its German keywords.
         """
-        k = top_k or self._top_k
-        entries = self._load_entries()
-        if not entries:
-            return []
-
-        query_terms = _tokenize(query)
-        if not query_terms:
-            return entries[-k:]
-
-        scored = []
-        for entry in entries:
-            entry_terms = _tokenize(entry.content)
-            score = _keyword_score(query_terms, entry_terms, entry.keywords)
-            if score > 0:
-                scored.append((score, entry))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        results = [entry for _, entry in scored[:k]]
-
-        # Safety net: if keyword matching found nothing at all, return
-        # recent entries so the LLM has some context. This handles the
-        # transition period for old entries stored without keywords.
-        if not results:
-            return entries[-k:]
-
-        return results
+        with self._lock:
+            k = top_k or self._top_k
+            entries = self._load_entries()
+            if not entries:
+                return []
+
+            query_terms = _tokenize(query)
+            if not query_terms:
+                return entries[-k:]
+
+            # Only entries sharing a token with the query can score above zero
+            index = self._get_token_index(entries)
+            entry_terms = self._entry_terms
+            candidates: set[int] = set()
+            for term in query_terms:
+                candidates.update(index.get(term, ()))
+
+            scored = []
+            for i in sorted(candidates):
+                score = _keyword_score(query_terms, *entry_terms[i])
+                if score > 0:
+                    scored.append((score, entries[i]))
+
+            # Same order as a stable descending sort, without sorting everything
+            results = [entry for _, entry in heapq.nlargest(k, scored, key=lambda x: x[0])]
+
+            # Safety net: if keyword matching found nothing at all, return
+            # recent entries so the LLM has some context. This handles the
+            # transition period for old entries stored without keywords.
+            if not results:
+                return entries[-k:]
+
+            return results
 
     def get_all(self, entry_type: str | None = None) -> list[MemoryEntry]:
         """Return all memory entries, optionally filtered by type."""
@@ -167,72 +249,96 @@ class MemoryManager:
             lines.append(f"[{entry.type}] {entry.content}")
         return "\n".join(lines)
 
+    def _get_token_index(self, entries: list[MemoryEntry]) -> dict[str, list[int]]:
+        """Return the inverted token index for the loaded entries, building it if needed."""
+        if self._token_index is not None:
+            return self._token_index
+        index: dict[str, list[int]] = {}
+        self._entry_terms = [_index_entry(index, i, entry) for i, entry in enumerate(entries)]
+        self._token_index = index
+        return index
+
     def _load_entries(self) -> list[MemoryEntry]:
         """Load all entries from the JSONL file (with caching)."""
-        if self._entries is not None:
+        with self._lock:
+            if self._entries is not None:
+                return self._entries
+
+            path = self._memory_path
+            if not path.exists():
+                self._entries = []
+                self._loaded_size = 0
+                return self._entries
+
+            # Stream the file line by line rather than holding a decoded copy of it
+            entries = []
+            loaded_size = 0
+            with open(path, "rb") as f:
+                for line_num, raw in enumerate(f, 1):
+                    loaded_size += len(raw)
+                    line = raw.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = _json_loads(line)
+                        entry = MemoryEntry(
+                            type=record.get("type", "fact"),
+                            content=record.get("content", ""),
+                            source=record.get("source", ""),
+                            timestamp=datetime.fromisoformat(record["timestamp"])
+                            if "timestamp" in record
+                            else datetime.now(timezone.utc),
+                            confidence=record.get("confidence", 1.0),
+                            metadata=record.get("metadata", {}),
+                            keywords=record.get("keywords", []),
+                        )
+                        entries.append(entry)
+                    except (json.JSONDecodeError, KeyError) as e:
+                        logger.warning("Skipping malformed entry at line %d: %s", line_num, e)
+
+            self._loaded_size = loaded_size
+            self._entries = entries
             return self._entries
 
-        path = self._memory_path
-        if not path.exists():
-            self._entries = []
-            return self._entries
 
-        entries = []
-        for line_num, line in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                record = json.loads(line)
-                entry = MemoryEntry(
-                    type=record.get("type", "fact"),
-                    content=record.get("content", ""),
-                    source=record.get("source", ""),
-                    timestamp=datetime.fromisoformat(record["timestamp"])
-                    if "timestamp" in record
-                    else datetime.now(timezone.utc),
-                    confidence=record.get("confidence", 1.0),
-                    metadata=record.get("metadata", {}),
-                    keywords=record.get("keywords", []),
-                )
-                entries.append(entry)
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning("Skipping malformed entry at line %d: %s", line_num, e)
+def _index_entry(
+    index: dict[str, list[int]], i: int, entry: MemoryEntry
+) -> tuple[Counter[str], set[str]]:
+    """Add entry ``i``'s content and keyword tokens to an inverted index.
 
-        self._entries = entries
-        return self._entries
+    Returns the entry's scoring inputs for ``_keyword_score``: content token
+    counts and the set of keyword tokens (keywords may be multi-word).
+    """
+    entry_freq = Counter(_tokenize(entry.content))
+    keyword_tokens: set[str] = set()
+    for kw in entry.keywords or ():
+        keyword_tokens.update(_tokenize(kw))
+    for token in entry_freq.keys() | keyword_tokens:
+        index.setdefault(token, []).append(i)
+    return entry_freq, keyword_tokens
 
 
 def _tokenize(text: str) -> list[str]:
     """Unicode-aware word tokenizer: lowercase, split on non-word characters."""
-    return [w for w in re.split(r"[^\w]+", text.lower(), flags=re.UNICODE) if len(w) > 1]
+    if text.isascii():
+        return [w for w in text.lower().translate(_ASCII_SEPARATORS).split() if len(w) > 1]
+    return [w for w in _WORD_SPLIT_RE.split(text.lower()) if len(w) > 1]
 
 
 def _keyword_score(
     query_terms: list[str],
-    entry_terms: list[str],
-    entry_keywords: list[str] | None = None,
+    entry_freq: Counter[str],
+    keyword_tokens: set[str],
 ) -> float:
     """Score an entry against query terms using term overlap.
 
     Matches against both content tokens and stored multilingual keywords.
     Keyword matches get a boost since they are LLM-curated search terms.
+    ``entry_freq`` and ``keyword_tokens`` are precomputed by ``_index_entry``.
     """
-    if not entry_terms and not entry_keywords:
-        return 0.0
-
-    entry_set = set(entry_terms)
-    entry_freq = Counter(entry_terms)
-
-    # Build keyword token set (keywords may be multi-word, so tokenize them)
-    keyword_tokens: set[str] = set()
-    if entry_keywords:
-        for kw in entry_keywords:
-            keyword_tokens.update(_tokenize(kw))
-
     matches = 0.0
     for term in query_terms:
-        if term in entry_set:
+        if term in entry_freq:
             # Content match — weight by inverse frequency
             matches += 1.0 / (1.0 + entry_freq[term])
         elif term in keyword_tokens:
@@ -39,8 +39,15 @@ class MemorySkill(BaseSkill):
 
     def on_load(self, ctx: KernelContext) -> None:
         self._managers: dict[str, MemoryManager] = {}
+        # Queries and background stores can race to create a profile's manager
+        self._managers_lock = threading.Lock()
         self._settings = ctx.settings
 
+    def on_unload(self) -> None:
+        with self._managers_lock:
+            for manager in self._managers.values():
+                manager.close()
+
     def handle(self, event: Event, ctx: KernelContext) -> SkillResult | None:
         if event.type == "memory_query":
             return self._handle_query(event, ctx)
@@ -50,13 +57,19 @@ class MemorySkill(BaseSkill):
 
     def _get_manager(self, profile_id: str, ctx: KernelContext) -> MemoryManager:
         """Get or create a MemoryManager for a profile."""
-        if profile_id not in self._managers:
-            self._managers[profile_id] = MemoryManager(
-                data_dir=ctx.data_dir,
-                profile_id=profile_id,
-                top_k=self._settings.memory.retrieval_top_k,
-            )
-        return self._managers[profile_id]
+        manager = self._managers.get(profile_id)
+        if manager is not None:
+            return manager
+        with self._managers_lock:
+            manager = self._managers.get(profile_id)
+            if manager is None:
+                manager = MemoryManager(
+                    data_dir=ctx.data_dir,
+                    profile_id=profile_id,
+                    top_k=self._settings.memory.retrieval_top_k,
+                )
+                self._managers[profile_id] = manager
+            return manager
 
     def _handle_query(self, event: Event, ctx: KernelContext) -> SkillResult:
         """Retrieve relevant memories and persona context for a query."""
@@ -14,8 +14,10 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
-import threading
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from clawless.user.guard import SafetyGuard
@@ -57,6 +59,17 @@ class ReasoningSkill(BaseSkill):
             blocklist_path=settings.safety.blocklist_file,
         )
         self._auto_propose = settings.skills.auto_propose
+        # One long-lived worker for memory storage: no thread start per turn,
+        # and stores for consecutive turns run in order
+        self._memory_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="memory-store")
+        # The registry and context are frozen at boot, so the skill section
+        # only needs building once per context; see _build_skill_descriptions
+        self._skill_desc_cache: tuple[KernelContext, str] | None = None
+        # profile_id → persona.md path, and → (st_mtime_ns, st_size, text)
+        self._persona_paths: dict[str, str] = {}
+        self._persona_cache: dict[str, tuple[int, int, str]] = {}
+        # profile_id → ((persona, persona_memories, skill_descriptions), (head, tail))
+        self._prompt_cache: dict[str, tuple[tuple[str, str, str], tuple[str, str]]] = {}
 
     def handle(self, event: Event, ctx: KernelContext) -> SkillResult | None:
         if event.type != "user_input":
@@ -98,13 +111,15 @@ class ReasoningSkill(BaseSkill):
         # 4. Build skill descriptions with routing instructions
         skill_descriptions = self._build_skill_descriptions(ctx)
 
-        # 5. Build system prompt
-        system_prompt = self._guard.build_system_prompt(
-            persona=persona_text,
-            persona_memories=persona_memories,
-            memory_context=memory_context,
-            skill_descriptions=skill_descriptions,
-        )
+        # 5. Build system prompt (only the memory context changes every turn)
+        static_key = (persona_text, persona_memories, skill_descriptions)
+        cached = self._prompt_cache.get(profile_id)
+        if cached is not None and cached[0] == static_key:
+            static_prompt = cached[1]
+        else:
+            static_prompt = self._guard.build_system_prompt_static(*static_key)
+            self._prompt_cache[profile_id] = (static_key, static_prompt)
+        system_prompt = self._guard.combine_system_prompt(static_prompt, memory_context)
 
         # 6. Call LLM (with tool-calling loop)
         llm_messages = [{"role": "system", "content": system_prompt}]
@@ -191,15 +206,16 @@ class ReasoningSkill(BaseSkill):
             assistant_text = "I generated a response but it was filtered by safety checks."
 
         # 9. Dispatch memory_store (background, non-blocking)
-        thread = threading.Thread(
-            target=self._store_memories,
-            args=(ctx, event, assistant_text),
-            daemon=True,
-        )
-        thread.start()
+        self._memory_worker.submit(self._store_memories, ctx, event, assistant_text)
 
         return SkillResult(success=True, output=assistant_text)
 
+    def on_unload(self) -> None:
+        # Drain the worker before the kernel closes the LLM router and the
+        # memory skill its managers (it unloads after this skill), so every
+        # queued store still lands
+        self._memory_worker.shutdown(wait=True)
+
     def _parse_action(self, text: str) -> tuple[str | None, str]:
         """Extract [ACTION:type] tag from LLM response.
 
@@ -225,16 +241,43 @@ class ReasoningSkill(BaseSkill):
             logger.exception("Background memory storage failed (non-fatal)")
 
     def _load_persona_file(self, ctx: KernelContext, profile_id: str) -> str:
-        """Load persona.md for the current profile, if it exists."""
-        persona_path = ctx.data_dir / "profiles" / profile_id / "persona.md"
-        if persona_path.is_file():
-            try:
-                return persona_path.read_text(encoding="utf-8")
-            except Exception:
-                logger.warning("Failed to read persona.md for profile %s", profile_id)
-        return ""
+        """Load persona.md for the current profile, if it exists.
+
+        The text is cached per profile and only re-read when the file's
+        mtime or size changes.
+        """
+        persona_path = self._persona_paths.get(profile_id)
+        if persona_path is None:
+            persona_path = str(ctx.data_dir / "profiles" / profile_id / "persona.md")
+            self._persona_paths[profile_id] = persona_path
+        try:
+            st = os.stat(persona_path)
+        except OSError:
+            return ""
+        if not stat.S_ISREG(st.st_mode):
+            return ""
+        cached = self._persona_cache.get(profile_id)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        try:
+            with open(persona_path, "rb") as f:
+                text = f.read().decode("utf-8")
+        except Exception:
+            logger.warning("Failed to read persona.md for profile %s", profile_id)
+            return ""
+        self._persona_cache[profile_id] = (st.st_mtime_ns, st.st_size, text)
+        return text
 
     def _build_skill_descriptions(self, ctx: KernelContext) -> str:
+        """Return the skill descriptions section, built once per kernel context."""
+        cached = self._skill_desc_cache
+        if cached is not None and cached[0] is ctx:
+            return cached[1]
+        text = self._render_skill_descriptions(ctx)
+        self._skill_desc_cache = (ctx, text)
+        return text
+
+    def _render_skill_descriptions(self, ctx: KernelContext) -> str:
         """Build skill descriptions with routing instructions for the LLM."""
         # List available skills (exclude ourselves and the communication skill)
         skill_lines = []